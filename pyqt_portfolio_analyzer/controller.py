@@ -1,11 +1,13 @@
 from .models.data_loader import DataLoader
 from .models.metrics import Metrics
+from .models.strategy_analysis import StrategyAnalyzer
 
 class Controller:
     def __init__(self, view):
         self.view = view
         self.loader = DataLoader()
         self.metrics = Metrics()
+        self.analyzer = StrategyAnalyzer()
 
     def load_files(self, paths):
         df = self.loader.load_multiple(paths)
@@ -16,5 +18,7 @@ class Controller:
             max_dd_threshold=self.view.get_ruin_rate(),
             n_sims=self.view.get_n_sims()
         )
+        breakdown = self.analyzer.analyze(df, initial_capital=100000)
         self.view.update_chart(equity)
         self.view.update_metrics(stats)
+        self.view.update_strategy_breakdown(breakdown)
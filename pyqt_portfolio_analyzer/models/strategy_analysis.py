@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+
+class StrategyAnalyzer:
+    """Per-file (strategy) breakdown of a combined portfolio on a shared daily grid."""
+
+    # 暦日グリッド（取引なしの日は 0）なので年率化は √365。
+    # Metrics.sharpe（トレード単位・√252）とは基準が異なるため "(Daily)" 列として区別する
+    PERIODS_PER_YEAR = 365
+    PORTFOLIO_ROW = "Portfolio"
+    # これより短い期間は年率化すると CAGR が発散するので NaN
+    MIN_CAGR_DAYS = 90
+
+    def __init__(self):
+        pass
+
+    # ---- 日次損益マトリクス ----
+    def daily_pnl_matrix(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        DataLoader の結合 DataFrame を (日付 × file) の日次損益マトリクスに変換する。
+        取引のない日・ファイルは 0 で埋め、全ファイル共通の暦日グリッドに揃える。
+        """
+        col = None
+        for c in df.columns:
+            if "損" in c and "益" in c:
+                col = c
+                break
+        if col is None:
+            raise ValueError("損益列が見つかりません。列名を確認してください。")
+        if len(df) == 0:
+            return pd.DataFrame(dtype=float)
+
+        day = pd.to_datetime(df['DateTime']).dt.normalize()
+        pnl = pd.to_numeric(df[col], errors='coerce').fillna(0.0).astype(float)
+        matrix = pnl.groupby([day, df['file']], sort=True).sum().unstack('file', fill_value=0.0)
+        grid = pd.date_range(matrix.index.min(), matrix.index.max(), freq='D')
+        matrix = matrix.reindex(grid, fill_value=0.0)
+        matrix.index.name = 'Date'
+        matrix.columns.name = 'file'
+        return matrix
+
+    # ---- 一括計算: 列ごとのエクイティに対する指標 ----
+    def _batch_metrics(self, pnl: np.ndarray, initial_capital: float) -> dict:
+        """
+        pnl: (日数 × 系列数)。各列を独立したエクイティカーブとして CAGR / MaxDD / Sharpe を計算。
+        期間が MIN_CAGR_DAYS 未満なら CAGR は NaN、エクイティが 0 以下になった系列の Sharpe は NaN。
+        """
+        n_days = pnl.shape[0]
+        equity = initial_capital + np.cumsum(pnl, axis=0)
+        prev = np.vstack([np.full((1, pnl.shape[1]), initial_capital), equity[:-1]])
+
+        net = equity[-1] - initial_capital
+
+        years = n_days / 365.25
+        end = equity[-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if n_days < self.MIN_CAGR_DAYS:
+                cagr = np.full(pnl.shape[1], np.nan)
+            else:
+                cagr = np.where(end > 0, (np.maximum(end, 0) / initial_capital) ** (1 / years) - 1, -1.0)
+
+            # 初期資本もピーク候補に含める
+            roll_max = np.maximum(np.maximum.accumulate(equity, axis=0), initial_capital)
+            mdd = ((equity - roll_max) / roll_max).min(axis=0)
+
+            rets = pnl / prev
+            std = rets.std(axis=0)
+            sharpe = np.where(std > 0, rets.mean(axis=0) / std * np.sqrt(self.PERIODS_PER_YEAR), 0.0)
+            # 前日エクイティが 0 以下だとリターンの符号・大きさが意味を持たない
+            sharpe = np.where((prev <= 0).any(axis=0), np.nan, sharpe)
+
+        return dict(net=net, cagr=cagr, mdd=mdd, sharpe=sharpe, equity=equity, roll_max=roll_max)
+
+    def correlation(self, pnl: np.ndarray) -> np.ndarray:
+        """日次損益の相関行列。分散ゼロの系列は NaN（対角は 1）。"""
+        centered = pnl - pnl.mean(axis=0)
+        std = centered.std(axis=0)
+        cov = centered.T @ centered / pnl.shape[0]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = cov / np.outer(std, std)
+        corr[:, std == 0] = np.nan
+        corr[std == 0, :] = np.nan
+        np.fill_diagonal(corr, 1.0)
+        return np.clip(corr, -1.0, 1.0)
+
+    # ---- 総合計算 ----
+    def analyze(self, df: pd.DataFrame, initial_capital: float) -> dict:
+        """
+        戻り値: dict
+          "strategies":  file ごとの単独指標・最大DD寄与・除外時 (leave-one-out) 指標の DataFrame
+          "portfolio":   同じ日次グリッド上の全体指標（LOO 比較の基準）。strategies と同じ列の Series
+          "correlation": file × file の日次損益相関 DataFrame
+        """
+        matrix = self.daily_pnl_matrix(df)
+        if matrix.empty:
+            return {"strategies": pd.DataFrame(), "portfolio": pd.Series(dtype=float),
+                    "correlation": pd.DataFrame()}
+
+        files = list(matrix.columns)
+        pnl = matrix.to_numpy(dtype=float)
+        total = pnl.sum(axis=1)
+
+        standalone = self._batch_metrics(pnl, initial_capital)
+        portfolio = self._batch_metrics(total[:, None], initial_capital)
+        # 1 系列ずつ除いたポートフォリオを一括で
+        loo = self._batch_metrics(total[:, None] - pnl, initial_capital)
+        if len(files) == 1:
+            # 唯一の file を外すと空のポートフォリオになるので LOO は定義しない
+            for key in ('cagr', 'mdd', 'sharpe'):
+                loo[key] = np.full(1, np.nan)
+
+        # ポートフォリオ最大DD区間（ピーク→ボトム）の損益を file ごとに分解。
+        # 区間内の損失合計（グロス）に対する割合なので、相殺があっても ±100% に収まる
+        port_equity = portfolio['equity'][:, 0]
+        dd = (port_equity - portfolio['roll_max'][:, 0]) / portfolio['roll_max'][:, 0]
+        trough = int(np.argmin(dd))
+        if dd[trough] < 0:
+            at_peak = port_equity[:trough + 1] >= portfolio['roll_max'][trough, 0]
+            peak = int(np.flatnonzero(at_peak)[-1]) + 1 if at_peak.any() else 0
+            window_pnl = pnl[peak:trough + 1].sum(axis=0)
+            gross_loss = -window_pnl[window_pnl < 0].sum()
+            dd_contrib = -window_pnl / gross_loss * 100
+        else:
+            dd_contrib = np.zeros(len(files))
+
+        port_mdd = portfolio['mdd'][0]
+        strategies = pd.DataFrame({
+            "Net Profit": standalone['net'],
+            "CAGR (%)": standalone['cagr'] * 100,
+            "Max Drawdown (Daily, %)": standalone['mdd'] * 100,
+            "Sharpe Ratio (Daily)": standalone['sharpe'],
+            "DD Contribution (%)": dd_contrib,
+            # 正の値 = その file を外すと最大DDが浅くなる
+            "ΔMax DD if Removed (%)": (loo['mdd'] - port_mdd) * 100,
+            "LOO CAGR (%)": loo['cagr'] * 100,
+            "LOO Max Drawdown (Daily, %)": loo['mdd'] * 100,
+            "LOO Sharpe Ratio (Daily)": loo['sharpe'],
+        }, index=pd.Index(files, name='file'))
+
+        # file 名と衝突しないよう全体指標は別の Series で返す
+        baseline = pd.Series(np.nan, index=strategies.columns, name=self.PORTFOLIO_ROW)
+        baseline["Net Profit"] = portfolio['net'][0]
+        baseline["CAGR (%)"] = portfolio['cagr'][0] * 100
+        baseline["Max Drawdown (Daily, %)"] = port_mdd * 100
+        baseline["Sharpe Ratio (Daily)"] = portfolio['sharpe'][0]
+        baseline["DD Contribution (%)"] = dd_contrib.sum()
+
+        correlation = pd.DataFrame(self.correlation(pnl), index=files, columns=files)
+        return {"strategies": strategies, "portfolio": baseline, "correlation": correlation}
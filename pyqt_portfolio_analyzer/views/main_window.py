@@ -1,13 +1,16 @@
 from PyQt6.QtCore import Qt, pyqtSignal, QSignalBlocker
+from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QMainWindow, QFileDialog, QWidget, QVBoxLayout, QPushButton, QLabel, QTableWidget,
     QTableWidgetItem, QSlider, QHBoxLayout, QGroupBox, QAbstractItemView, QHeaderView,
-    QStackedLayout, QDoubleSpinBox, QSpinBox
+    QStackedLayout, QDoubleSpinBox, QSpinBox, QTabWidget
 )
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from pathlib import Path
+import math
 from ..controller import Controller
+from ..models.strategy_analysis import StrategyAnalyzer
 
 # ---------- 翻訳辞書（Equity Curve は除外） ----------
 TRANSLATIONS = {
@@ -26,7 +29,12 @@ TRANSLATIONS = {
         "ファイル名":"ファイル名","File Name":"ファイル名","削除":"削除","Remove":"削除",
         "Ready":"準備完了","準備完了":"準備完了","file(s) added":"件追加","No new files added":"新規ファイルなし",
         "File removed":"ファイル削除","All files cleared":"全ファイルをクリア",
-        "Metric":"指標","Value":"値","指標":"指標","値":"値"
+        "Metric":"指標","Value":"値","指標":"指標","値":"値",
+        "Net Profit":"純損益","DD Contribution (%)":"最大DD寄与 (%)","ΔMax DD if Removed (%)":"除外時の最大DD改善 (%)",
+        "Max Drawdown (Daily, %)":"最大ドローダウン (日次, %)","Sharpe Ratio (Daily)":"シャープレシオ (日次)",
+        "LOO CAGR (%)":"除外時 CAGR (%)","LOO Max Drawdown (Daily, %)":"除外時 最大ドローダウン (日次, %)",
+        "LOO Sharpe Ratio (Daily)":"除外時 シャープレシオ (日次)","Portfolio":"ポートフォリオ",
+        "Strategies":"戦略別","戦略別":"戦略別","Correlation":"相関","相関":"相関"
     },
     "en": {
         "最大ドローダウン (%)":"Max Drawdown (%)","シャープレシオ":"Sharpe Ratio","ソルティノレシオ":"Sortino Ratio",
@@ -41,7 +49,12 @@ TRANSLATIONS = {
         "ファイル名":"File Name","削除":"Remove",
         "準備完了":"Ready","件追加":"file(s) added","新規ファイルなし":"No new files added",
         "ファイル削除":"File removed","全ファイルをクリア":"All files cleared",
-        "指標":"Metric","値":"Value"
+        "指標":"Metric","値":"Value",
+        "純損益":"Net Profit","最大DD寄与 (%)":"DD Contribution (%)","除外時の最大DD改善 (%)":"ΔMax DD if Removed (%)",
+        "最大ドローダウン (日次, %)":"Max Drawdown (Daily, %)","シャープレシオ (日次)":"Sharpe Ratio (Daily)",
+        "除外時 CAGR (%)":"LOO CAGR (%)","除外時 最大ドローダウン (日次, %)":"LOO Max Drawdown (Daily, %)",
+        "除外時 シャープレシオ (日次)":"LOO Sharpe Ratio (Daily)","ポートフォリオ":"Portfolio",
+        "戦略別":"Strategies","相関":"Correlation"
     }
 }
 
@@ -188,6 +201,19 @@ class MainWindow(QMainWindow):
         self.table = QTableWidget()
         main_vbox.addWidget(self.table)
 
+        # 戦略別（file ごと）の指標テーブル＋相関ヒートマップ
+        self.breakdown_tabs = QTabWidget()
+        self.strategy_table = QTableWidget()
+        self.strategy_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.breakdown_tabs.addTab(self.strategy_table, "")
+        self.corr_canvas = FigureCanvas(Figure(figsize=(6, 3)))
+        self.corr_ax = self.corr_canvas.figure.subplots()
+        self._corr_cbar = None
+        self._init_corr_appearance()
+        self.corr_canvas.mpl_connect("motion_notify_event", self.on_corr_hover)
+        self.breakdown_tabs.addTab(self.corr_canvas, "")
+        main_vbox.addWidget(self.breakdown_tabs)
+
         file_group = QGroupBox("")
         file_vbox = QVBoxLayout(file_group)
         self.drop_area = FileDropArea()
@@ -218,6 +244,8 @@ class MainWindow(QMainWindow):
         QPushButton:hover { background: #44484e; }
         QTableWidget { background: #282c34; color: #eaeaea; }
         QHeaderView::section { background: #393e46; color: #eaeaea; }
+        QTabBar::tab { background: #35393e; padding: 4px 10px; }
+        QTabBar::tab:selected { background: #44484e; }
         QSlider::groove:horizontal { background: #282c34; height:6px; }
         QSlider::handle:horizontal { background: #eaeaea; width:14px; }
         """)
@@ -244,6 +272,8 @@ class MainWindow(QMainWindow):
         self.sims_label.setText(self._format_sims_label())
         self.ax.set_title("Equity Curve", color="white")
         self.canvas.draw()
+        self.breakdown_tabs.setTabText(0, self.tr_key("戦略別"))
+        self.breakdown_tabs.setTabText(1, self.tr_key("相関"))
 
     def _init_chart_appearance(self):
         self.ax.set_facecolor("#282c34")
@@ -252,6 +282,19 @@ class MainWindow(QMainWindow):
         for spine in self.ax.spines.values():
             spine.set_color("white")
 
+    def _init_corr_appearance(self):
+        if self._corr_cbar is not None:
+            self._corr_cbar.remove()
+            self._corr_cbar = None
+        self.corr_ax.clear()
+        self._corr_frame = None
+        self._corr_hover = None
+        self.corr_ax.set_facecolor("#282c34")
+        self.corr_canvas.figure.set_facecolor("#282c34")
+        self.corr_ax.tick_params(colors="white")
+        for spine in self.corr_ax.spines.values():
+            spine.set_color("white")
+
     def on_dd_slider_changed(self, value: int):
         if self._building: return
         with QSignalBlocker(self.dd_spin):
@@ -377,6 +420,10 @@ class MainWindow(QMainWindow):
         self.canvas.draw()
         self.table.clearContents()
         self.table.setRowCount(0); self.table.setColumnCount(0)
+        self.strategy_table.clearContents()
+        self.strategy_table.setRowCount(0); self.strategy_table.setColumnCount(0)
+        self._init_corr_appearance()
+        self.corr_canvas.draw()
 
     def update_chart(self, equity):
         self.ax.clear()
@@ -409,6 +456,65 @@ class MainWindow(QMainWindow):
                 display = str(v)
             self.table.setItem(row, col+1, QTableWidgetItem(display))
 
+    def update_strategy_breakdown(self, breakdown: dict):
+        strategies = breakdown["strategies"]
+        portfolio = breakdown["portfolio"]
+        corr = breakdown["correlation"]
+
+        self.strategy_table.clearContents()
+        if strategies.empty:
+            self.strategy_table.setRowCount(0); self.strategy_table.setColumnCount(0)
+        else:
+            self.strategy_table.setRowCount(len(strategies) + 1)
+            self.strategy_table.setColumnCount(len(strategies.columns) + 1)
+            self.strategy_table.setHorizontalHeaderLabels(
+                [self.tr_key("ファイル名")] + [self.tr_key(c) for c in strategies.columns]
+            )
+            # 先頭行は全体（基準）。太字にして file 行と区別し、file 名は翻訳しない
+            bold = QFont(); bold.setBold(True)
+            rows = [(self.tr_key(StrategyAnalyzer.PORTFOLIO_ROW), portfolio, bold)]
+            rows += [(str(name), values, None) for name, values in strategies.iterrows()]
+            for row, (label, values, font) in enumerate(rows):
+                items = [QTableWidgetItem(label)] + [QTableWidgetItem(f"{v:.2f}") for v in values]
+                for col, item in enumerate(items):
+                    if font is not None: item.setFont(font)
+                    self.strategy_table.setItem(row, col, item)
+
+        self._init_corr_appearance()
+        if len(corr):
+            im = self.corr_ax.imshow(corr.to_numpy(), cmap="RdBu_r", vmin=-1, vmax=1,
+                                     interpolation="nearest", aspect="auto")
+            self._corr_cbar = self.corr_canvas.figure.colorbar(im, ax=self.corr_ax)
+            self._corr_cbar.ax.tick_params(colors="white")
+            # 戦略数が多いとラベルが潰れるので最大 30 本に間引く（全セルはホバーで確認）
+            ticks = range(0, len(corr), max(1, math.ceil(len(corr) / 30)))
+            self.corr_ax.set_xticks(ticks, [str(corr.columns[i]) for i in ticks], rotation=90, fontsize=7)
+            self.corr_ax.set_yticks(ticks, [str(corr.index[i]) for i in ticks], fontsize=7)
+            self._corr_frame = corr
+            self._corr_hover = self.corr_ax.annotate(
+                "", xy=(0, 0), xytext=(8, 8), textcoords="offset points", color="white", fontsize=8,
+                bbox=dict(boxstyle="round", fc="#35393e", ec="#888"), visible=False
+            )
+        self.corr_ax.set_title("Correlation", color="white")
+        self.corr_canvas.figure.tight_layout()
+        self.corr_canvas.draw()
+
+    def on_corr_hover(self, event):
+        if self._corr_hover is None: return
+        corr = self._corr_frame
+        inside = event.inaxes is self.corr_ax and event.xdata is not None
+        i = int(round(event.ydata)) if inside else -1
+        j = int(round(event.xdata)) if inside else -1
+        if 0 <= i < len(corr) and 0 <= j < len(corr):
+            self._corr_hover.xy = (j, i)
+            self._corr_hover.set_text(f"{corr.index[i]} × {corr.columns[j]} = {corr.iat[i, j]:.2f}")
+            self._corr_hover.set_visible(True)
+        elif self._corr_hover.get_visible():
+            self._corr_hover.set_visible(False)
+        else:
+            return
+        self.corr_canvas.draw_idle()
+
     def get_ruin_rate(self) -> float:
         return self._ruin_rate
     def get_n_sims(self) -> int:
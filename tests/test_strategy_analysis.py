@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+from pyqt_portfolio_analyzer.models.strategy_analysis import StrategyAnalyzer
+
+def _frame():
+    return pd.DataFrame({
+        'DateTime': pd.to_datetime(["2020-01-01 09:00", "2020-01-01 15:00", "2020-01-03 09:00", "2020-01-04 09:00", "2020-01-04 10:00"]),
+        '損益': [100.0, 50.0, -300.0, 200.0, -100.0],
+        'file': ["a", "a", "b", "a", "b"],
+    })
+
+def test_daily_pnl_matrix_shared_grid():
+    matrix = StrategyAnalyzer().daily_pnl_matrix(_frame())
+    assert list(matrix.columns) == ["a", "b"]
+    assert len(matrix) == 4  # 01-01 .. 01-04（取引のない 01-02 も含む）
+    assert matrix.loc["2020-01-01", "a"] == 150.0
+    assert matrix.loc["2020-01-02"].sum() == 0.0
+
+def test_analyze_leave_one_out_and_dd_contribution():
+    result = StrategyAnalyzer().analyze(_frame(), initial_capital=1000)
+    strategies = result["strategies"]
+    # "a" を除いたポートフォリオ = "b" 単独
+    assert np.isclose(strategies.loc["a", "LOO Max Drawdown (Daily, %)"], strategies.loc["b", "Max Drawdown (Daily, %)"])
+    assert np.isclose(strategies["DD Contribution (%)"].sum(), 100.0)
+    assert strategies.loc["b", "DD Contribution (%)"] == 100.0
+    corr = result["correlation"]
+    assert corr.shape == (2, 2)
+    assert np.allclose(np.diag(corr), 1.0)
+
+def test_correlation_matches_corrcoef_and_nan_for_flat():
+    rng = np.random.default_rng(0)
+    pnl = rng.normal(size=(50, 3))
+    pnl[:, 2] = 0.0  # 分散ゼロ
+    corr = StrategyAnalyzer().correlation(pnl)
+    assert np.allclose(corr[:2, :2], np.corrcoef(pnl[:, :2], rowvar=False))
+    assert np.isnan(corr[2, 0]) and np.isnan(corr[0, 2])
+    assert corr[2, 2] == 1.0
+
+def test_analyze_empty_frame():
+    empty = pd.DataFrame({'DateTime': pd.to_datetime([]), '損益': [], 'file': []})
+    result = StrategyAnalyzer().analyze(empty, initial_capital=1000)
+    assert result["strategies"].empty
+    assert result["portfolio"].empty
+    assert result["correlation"].empty
+
+def test_delta_max_dd_sign_and_portfolio_baseline():
+    days = pd.date_range("2020-01-01", periods=200, freq='D')
+    df = pd.DataFrame({
+        'DateTime': list(days) * 2,
+        '損益': [10.0] * 200 + [-300.0 if i == 100 else 0.0 for i in range(200)],
+        'file': ["steady"] * 200 + ["loser"] * 200,
+    })
+    result = StrategyAnalyzer().analyze(df, initial_capital=1000)
+    strategies = result["strategies"]
+    port_mdd = result["portfolio"]["Max Drawdown (Daily, %)"]
+    # "loser" を外すと最大DDが浅くなる → 正、"steady" を外すと深くなる → 負
+    assert strategies.loc["loser", "ΔMax DD if Removed (%)"] > 0
+    assert strategies.loc["steady", "ΔMax DD if Removed (%)"] < 0
+    for name in ("loser", "steady"):
+        assert np.isclose(port_mdd + strategies.loc[name, "ΔMax DD if Removed (%)"],
+                          strategies.loc[name, "LOO Max Drawdown (Daily, %)"])
+    assert np.isnan(result["portfolio"]["LOO CAGR (%)"])
+
+def test_single_file_loo_and_short_span_cagr_are_nan():
+    df = _frame()
+    df['file'] = "a"
+    strategies = StrategyAnalyzer().analyze(df, initial_capital=1000)["strategies"]
+    loo_cols = ["ΔMax DD if Removed (%)", "LOO CAGR (%)", "LOO Max Drawdown (Daily, %)", "LOO Sharpe Ratio (Daily)"]
+    assert strategies.loc["a", loo_cols].isna().all()
+    # 4 日分しかないので年率化しない
+    assert strategies["CAGR (%)"].isna().all()
+
+def test_sharpe_nan_when_equity_not_positive():
+    df = pd.DataFrame({
+        'DateTime': pd.date_range("2020-01-01", periods=4, freq='D'),
+        '損益': [100.0, -1600.0, 50.0, 20.0],
+        'file': "a",
+    })
+    strategies = StrategyAnalyzer().analyze(df, initial_capital=1000)["strategies"]
+    assert np.isnan(strategies.loc["a", "Sharpe Ratio (Daily)"])
+
+def test_file_named_portfolio_does_not_collide_with_baseline():
+    df = _frame()
+    df['file'] = df['file'].map({"a": "Portfolio", "b": "x"})
+    result = StrategyAnalyzer().analyze(df, initial_capital=1000)
+    assert list(result["strategies"].index) == ["Portfolio", "x"]
+    assert result["strategies"].index.is_unique
+    assert np.isclose(result["portfolio"]["Net Profit"], _frame()['損益'].sum())
+
+def test_dd_contribution_bounded_when_gains_offset_losses():
+    df = pd.DataFrame({
+        'DateTime': pd.to_datetime(["2020-01-01 09:00", "2020-01-02 09:00", "2020-01-02 10:00"]),
+        '損益': [50.0, -100.0, 90.0],
+        'file': ["loser", "loser", "hedge"],
+    })
+    result = StrategyAnalyzer().analyze(df, initial_capital=1000)
+    contrib = result["strategies"]["DD Contribution (%)"]
+    assert np.isclose(contrib["loser"], 100.0)
+    assert np.isclose(contrib["hedge"], -90.0)
+    assert np.isclose(result["portfolio"]["DD Contribution (%)"], 10.0)